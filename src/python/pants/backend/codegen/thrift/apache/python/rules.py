@@ -26,7 +26,7 @@ from pants.backend.python.subsystems.setup import PythonSetup
 from pants.backend.python.target_types import PythonSourceField
 from pants.engine.fs import AddPrefix
 from pants.engine.intrinsics import digest_to_snapshot
-from pants.engine.rules import collect_rules, implicitly, rule
+from pants.engine.rules import collect_rules, concurrently, implicitly, rule
 from pants.engine.target import (
     FieldSet,
     GeneratedSources,
@@ -49,24 +49,25 @@ async def generate_python_from_thrift(
     request: GeneratePythonFromThriftRequest,
     thrift_python: ThriftPythonSubsystem,
 ) -> GeneratedSources:
-    result = await generate_apache_thrift_sources(
-        GenerateThriftSourcesRequest(
-            thrift_source_field=request.protocol_target[ThriftSourceField],
-            lang_id="py",
-            lang_options=thrift_python.gen_options,
-            lang_name="Python",
-        ),
-        **implicitly(),
-    )
-
     # We must add back the source root for Python imports to work properly. Note that the file
     # paths will be different depending on whether `namespace py` was used. See the tests for
     # examples.
-    source_root = await get_source_root(SourceRootRequest.for_target(request.protocol_target))
-    source_root_restored = (
-        await digest_to_snapshot(**implicitly(AddPrefix(result.snapshot.digest, source_root.path)))
-        if source_root.path != "."
-        else await digest_to_snapshot(result.snapshot.digest)
+    result, source_root = await concurrently(
+        generate_apache_thrift_sources(
+            GenerateThriftSourcesRequest(
+                thrift_source_field=request.protocol_target[ThriftSourceField],
+                lang_id="py",
+                lang_options=thrift_python.gen_options,
+                lang_name="Python",
+            ),
+            **implicitly(),
+        ),
+        get_source_root(SourceRootRequest.for_target(request.protocol_target)),
+    )
+    if source_root.path == ".":
+        return GeneratedSources(result.snapshot)
+    source_root_restored = await digest_to_snapshot(
+        **implicitly(AddPrefix(result.snapshot.digest, source_root.path))
     )
     return GeneratedSources(source_root_restored)
 
@@ -2,9 +2,8 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
-import os.path
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from pants.backend.javascript import nodejs_project_environment
 from pants.backend.javascript.dependency_inference.rules import rules as dependency_inference_rules
@@ -34,69 +33,82 @@ from pants.engine.internals.native_engine import AddPrefix, Digest, MergeDigests
 from pants.engine.intrinsics import add_prefix, merge_digests
 from pants.engine.process import fallible_to_exec_result_or_raise
 from pants.engine.rules import Rule, collect_rules, implicitly, rule
-from pants.engine.target import SourcesField, Target, TransitiveTargetsRequest
-from pants.engine.unions import UnionMembership, UnionRule
+from pants.engine.target import SourcesField, Target, TransitiveTargets, TransitiveTargetsRequest
+from pants.engine.unions import UnionRule
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstalledNodePackageRequest:
     address: Address
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstalledNodePackage:
     project_env: NodeJsProjectEnvironment
     digest: Digest
+    project_dir: str = field(init=False, repr=False, compare=False)
+    target: Target = field(init=False, repr=False, compare=False)
+    package_manager: PackageManager = field(init=False, repr=False, compare=False)
 
-    @property
-    def project_dir(self) -> str:
-        return self.project_env.root_dir
+    def __post_init__(self) -> None:
+        # These are read repeatedly by consumers of an installation, so we resolve them once.
+        object.__setattr__(self, "project_dir", self.project_env.root_dir)
+        object.__setattr__(self, "target", self.project_env.ensure_target())
+        object.__setattr__(self, "package_manager", self.project_env.project.package_manager)
 
     def join_relative_workspace_directory(self, path: str) -> str:
-        return os.path.join(self.project_env.relative_workspace_directory(), path)
+        relative_workspace_directory = self.project_env.relative_workspace_directory()
+        return f"{relative_workspace_directory}/{path}" if relative_workspace_directory else path
 
-    @property
-    def target(self) -> Target:
-        return self.project_env.ensure_target()
 
-    @property
-    def package_manager(self) -> PackageManager:
-        return self.project_env.project.package_manager
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstalledNodePackageWithSource(InstalledNodePackage):
     pass
 
 
+_PACKAGE_SOURCE_TYPES = (PackageJsonSourceField, FileSourceField)
+_JS_SOURCE_TYPES = (ResourceSourceField, JSRuntimeSourceField)
+
+
+def _sources_fields(targets: Iterable[Target]) -> list[SourcesField]:
+    return [tgt[SourcesField] for tgt in targets if tgt.has_field(SourcesField)]
+
+
 async def _get_relevant_source_files(
-    sources: Iterable[SourcesField], with_js: bool = False
+    sources: Iterable[SourcesField], for_sources_types: tuple[type[SourcesField], ...]
 ) -> SourceFiles:
     return await determine_source_files(
-        SourceFilesRequest(
-            sources,
-            for_sources_types=(PackageJsonSourceField, FileSourceField)
-            + ((ResourceSourceField, JSRuntimeSourceField) if with_js else ()),
-            enable_codegen=True,
-        )
+        SourceFilesRequest(sources, for_sources_types=for_sources_types, enable_codegen=True)
     )
 
 
+@dataclass(frozen=True, slots=True)
+class _InstallNodeModulesRequest:
+    project_env: NodeJsProjectEnvironment
+
+
+@dataclass(frozen=True, slots=True)
+class _InstalledNodeModules:
+    project_env: NodeJsProjectEnvironment
+    transitive_targets: TransitiveTargets
+    package_digest: Digest
+    node_modules_digest: Digest
+
+
 @rule
-async def install_node_packages_for_address(
-    req: InstalledNodePackageRequest,
-    union_membership: UnionMembership,
+async def install_node_modules(
+    req: _InstallNodeModulesRequest,
     nodejs: nodejs.NodeJS,
-) -> InstalledNodePackage:
-    project_env = await get_nodejs_environment(NodeJSProjectEnvironmentRequest(req.address))
+) -> _InstalledNodeModules:
+    project_env = req.project_env
     target = project_env.ensure_target()
     transitive_tgts = await transitive_targets(
         TransitiveTargetsRequest([target.address]), **implicitly()
     )
 
     source_files = await _get_relevant_source_files(
-        (tgt[SourcesField] for tgt in transitive_tgts.closure if tgt.has_field(SourcesField)),
-        with_js=False,
+        _sources_fields(transitive_tgts.closure),
+        for_sources_types=_PACKAGE_SOURCE_TYPES,
     )
     package_digest = source_files.snapshot.digest
 
@@ -107,39 +119,64 @@ async def install_node_packages_for_address(
                 project_env.project.immutable_install_args,
                 description=f"Installing {target[NodePackageNameField].value}@{target[NodePackageVersionField].value}.",
                 input_digest=package_digest,
-                output_directories=tuple(project_env.node_modules_directories),
+                output_directories=project_env.node_modules_directories,
             )
         )
     )
     node_modules = await add_prefix(AddPrefix(install_result.output_digest, project_env.root_dir))
 
-    return InstalledNodePackage(
+    return _InstalledNodeModules(
         project_env,
-        digest=await merge_digests(
-            MergeDigests(
-                [
-                    package_digest,
-                    node_modules,
-                ]
-            )
-        ),
+        transitive_targets=transitive_tgts,
+        package_digest=package_digest,
+        node_modules_digest=node_modules,
     )
 
 
+@rule
+async def install_node_modules_for_address(
+    req: InstalledNodePackageRequest,
+) -> _InstalledNodeModules:
+    # Every address owned by the same package resolves to the same project environment, so
+    # keying the installation on the environment lets those addresses share a single install.
+    project_env = await get_nodejs_environment(NodeJSProjectEnvironmentRequest(req.address))
+    return await install_node_modules(_InstallNodeModulesRequest(project_env), **implicitly())
+
+
+@rule
+async def install_node_packages_for_address(
+    req: InstalledNodePackageRequest,
+) -> InstalledNodePackage:
+    installation = await install_node_modules_for_address(req, **implicitly())
+    digest = await merge_digests(
+        MergeDigests((installation.package_digest, installation.node_modules_digest))
+    )
+    return InstalledNodePackage(installation.project_env, digest=digest)
+
+
 @rule
 async def add_sources_to_installed_node_package(
     req: InstalledNodePackageRequest,
 ) -> InstalledNodePackageWithSource:
-    installation = await install_node_packages_for_address(req, **implicitly())
-    transitive_tgts = await transitive_targets(
-        TransitiveTargetsRequest([installation.target.address]), **implicitly()
-    )
+    # Reuse the transitive targets computed for the installation rather than walking the
+    # dependency graph a second time.
+    installation = await install_node_modules_for_address(req, **implicitly())
 
+    # The installation's package digest already holds the package and file sources of the whole
+    # transitive closure, so only the JS sources remain to be hydrated.
     source_files = await _get_relevant_source_files(
-        (tgt[SourcesField] for tgt in transitive_tgts.dependencies if tgt.has_field(SourcesField)),
-        with_js=True,
+        _sources_fields(installation.transitive_targets.dependencies),
+        for_sources_types=_JS_SOURCE_TYPES,
+    )
+    digest = await merge_digests(
+        MergeDigests(
+            (
+                installation.package_digest,
+                installation.node_modules_digest,
+                source_files.snapshot.digest,
+            )
+        )
     )
-    digest = await merge_digests(MergeDigests((installation.digest, source_files.snapshot.digest)))
     return InstalledNodePackageWithSource(installation.project_env, digest=digest)
 
 
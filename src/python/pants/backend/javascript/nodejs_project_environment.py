@@ -5,6 +5,7 @@ from __future__ import annotations
 import os.path
 from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import cached_property
 
 from pants.backend.javascript import package_json, resolve
 from pants.backend.javascript.nodejs_project import NodeJSProject
@@ -59,11 +60,14 @@ class NodeJsProjectEnvironment:
     def root_dir(self) -> str:
         return self.project.root_dir
 
-    @property
-    def node_modules_directories(self) -> Iterable[str]:
-        yield "node_modules"
+    @cached_property
+    def node_modules_directories(self) -> tuple[str, ...]:
         if self.package and not self.project.single_workspace:
-            yield os.path.join(self.relative_workspace_directory(), "node_modules")
+            return (
+                "node_modules",
+                os.path.join(self.relative_workspace_directory(), "node_modules"),
+            )
+        return ("node_modules",)
 
     @property
     def target(self) -> Target | None:
@@ -6,9 +6,10 @@ from __future__ import annotations
 import itertools
 import logging
 import os.path
+from collections import defaultdict
 from collections.abc import Collection, Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
-from itertools import groupby
+from functools import cached_property, lru_cache
 from typing import ClassVar
 
 from nodesemver import min_satisfying
@@ -200,11 +201,11 @@ class NodeJS(Subsystem, TemplatedExternalToolOptionsMixin):
         advanced=True,
     )
 
-    @property
+    @cached_property
     def tools(self) -> tuple[str, ...]:
         return tuple(sorted(set(self._tools)))
 
-    @property
+    @cached_property
     def optional_tools(self) -> tuple[str, ...]:
         return tuple(sorted(set(self._optional_tools)))
 
@@ -264,7 +265,7 @@ class NodeJS(Subsystem, TemplatedExternalToolOptionsMixin):
             advanced=True,
         )
 
-        @property
+        @cached_property
         def corepack_env_vars(self) -> tuple[str, ...]:
             return tuple(sorted(set(self._corepack_env_vars)))
 
@@ -336,35 +337,48 @@ class NodeJSProcessEnvironment:
     corepack_env_vars: EnvironmentVars
 
     base_bin_dir: ClassVar[str] = "__node"
+    corepack_shims_dir: ClassVar[str] = f"{{chroot}}/{base_bin_dir}/._corepack"
+
+    @cached_property
+    def _path(self) -> str:
+        return os.pathsep.join(
+            (self.tool_binaries.path_component, self.corepack_shims, self.binary_directory)
+        )
+
+    @cached_property
+    def _env(self) -> FrozenDict[str, str]:
+        return FrozenDict(
+            {
+                "npm_config_cache": self.npm_config_cache,  # Normally stored at ~/.npm,
+                "COREPACK_HOME": f"{{chroot}}/{self.corepack_home}",
+                **self.corepack_env_vars,
+            }
+        )
 
     def to_env_dict(self, extras: Mapping[str, str] | None = None) -> dict[str, str]:
         extras = extras or {}
         extra_path = extras.get("PATH", "")
-        path = [self.tool_binaries.path_component, self.corepack_shims, self.binary_directory]
-        if extra_path:
-            path.append(extra_path)
 
         return {
             **extras,
-            "PATH": os.pathsep.join(path),
-            "npm_config_cache": self.npm_config_cache,  # Normally stored at ~/.npm,
-            "COREPACK_HOME": os.path.join("{chroot}", self.corepack_home),
-            **self.corepack_env_vars,
+            "PATH": f"{self._path}{os.pathsep}{extra_path}" if extra_path else self._path,
+            **self._env,
         }
 
-    @property
-    def append_only_caches(self) -> Mapping[str, str]:
-        return {"npm": self.npm_config_cache}
+    @cached_property
+    def append_only_caches(self) -> FrozenDict[str, str]:
+        return FrozenDict({"npm": self.npm_config_cache})
 
     @property
     def binary_directory(self) -> str:
         return self.binaries.binary_dir
 
-    def immutable_digest(self) -> dict[str, Digest]:
-        return (
+    @cached_property
+    def immutable_digest(self) -> FrozenDict[str, Digest]:
+        return FrozenDict(
             {self.base_bin_dir: self.binaries.digest, **self.tool_binaries.immutable_input_digests}
             if self.binaries.digest
-            else {**self.tool_binaries.immutable_input_digests}
+            else self.tool_binaries.immutable_input_digests
         )
 
 
@@ -372,8 +386,13 @@ async def add_corepack_shims_to_digest(
     binaries: NodeJSBinaries, tool_shims: BinaryShims, corepack_env_vars: EnvironmentVars
 ) -> Digest:
     directory_digest = await create_digest(CreateDigest([Directory("._corepack")]))
-    binary_digest = binaries.digest if binaries.digest else EMPTY_DIGEST
-    input_digest = await merge_digests(MergeDigests((directory_digest, binary_digest)))
+    # Node.js binaries found on the search path have no digest, in which case there is nothing to
+    # merge on either side of the `corepack enable` process.
+    input_digest = (
+        await merge_digests(MergeDigests((directory_digest, binaries.digest)))
+        if binaries.digest
+        else directory_digest
+    )
 
     none_immutable_binary_path = binaries.binary_dir.replace(
         f"/{NodeJSProcessEnvironment.base_bin_dir}", ""
@@ -403,7 +422,11 @@ async def add_corepack_shims_to_digest(
             )
         )
     )
-    return await merge_digests(MergeDigests((binary_digest, enable_corepack_result.output_digest)))
+    if not binaries.digest:
+        return enable_corepack_result.output_digest
+    return await merge_digests(
+        MergeDigests((binaries.digest, enable_corepack_result.output_digest))
+    )
 
 
 async def get_nodejs_process_tools_shims(
@@ -418,16 +441,15 @@ async def get_nodejs_process_tools_shims(
         for binary_name in (*tools, *optional_tools)
     ]
     paths = await concurrently(find_binary(request, **implicitly()) for request in requests)
-    required_tools_paths = [
-        path.first_path_or_raise(request, rationale=rationale)
-        for request, path in zip(requests, paths)
-        if request.binary_name in tools
-    ]
-    optional_tools_paths = [
-        path.first_path
-        for request, path in zip(requests, paths)
-        if request.binary_name in optional_tools and path.first_path
-    ]
+    tools_set = set(tools)
+    optional_tools_set = set(optional_tools)
+    required_tools_paths = []
+    optional_tools_paths = []
+    for request, path in zip(requests, paths):
+        if request.binary_name in tools_set:
+            required_tools_paths.append(path.first_path_or_raise(request, rationale=rationale))
+        elif request.binary_name in optional_tools_set and path.first_path:
+            optional_tools_paths.append(path.first_path)
 
     tools_shims = await create_binary_shims(
         BinaryShimsRequest.for_paths(
@@ -475,9 +497,7 @@ async def node_process_environment(
         npm_config_cache="._npm",
         tool_binaries=binary_shims,
         corepack_home="._corepack_home",
-        corepack_shims=os.path.join(
-            "{chroot}", NodeJSProcessEnvironment.base_bin_dir, "._corepack"
-        ),
+        corepack_shims=NodeJSProcessEnvironment.corepack_shims_dir,
         corepack_env_vars=corepack_env_vars,
     )
 
@@ -505,6 +525,10 @@ async def _get_nvm_root() -> str | None:
 async def _nodejs_search_paths(
     env_tgt: EnvironmentTarget, paths: Collection[str]
 ) -> tuple[str, ...]:
+    if tuple(paths) == ("<PATH>",):
+        # The default search path needs neither the asdf nor the NVM lookups below.
+        return tuple(await environment_path_variable(**implicitly()))
+
     asdf_result = await AsdfToolPathsResult.get_un_cachable_search_paths(
         paths,
         env_tgt=env_tgt,
@@ -519,26 +543,32 @@ async def _nodejs_search_paths(
         AsdfPathString.LOCAL: asdf_local_tool_paths,
     }
     nvm_dir = await _get_nvm_root()
-    expanded: list[str] = []
-    nvm_path_results = await concurrently(
-        get_un_cachable_version_manager_paths(
-            VersionManagerSearchPathsRequest(
-                env_tgt,
-                nvm_dir,
-                "versions/node",
-                f"[{NodeJS.options_scope}].search_path",
-                (".nvmrc",),
-                s if s == "<NVM_LOCAL>" else None,
-            ),
-        )
-        for s in paths
-        if s == "<NVM>" or s == "<NVM_LOCAL>"
+    # Only look up PATH when it is going to be expanded: in docker and remote environments the
+    # lookup runs `env` in that environment.
+    path_variable_lookups = [environment_path_variable(**implicitly())] if "<PATH>" in paths else []
+    nvm_path_results, path_variables = await concurrently(
+        concurrently(
+            get_un_cachable_version_manager_paths(
+                VersionManagerSearchPathsRequest(
+                    env_tgt,
+                    nvm_dir,
+                    "versions/node",
+                    f"[{NodeJS.options_scope}].search_path",
+                    (".nvmrc",),
+                    s if s == "<NVM_LOCAL>" else None,
+                ),
+            )
+            for s in paths
+            if s == "<NVM>" or s == "<NVM_LOCAL>"
+        ),
+        concurrently(path_variable_lookups),
     )
-    for nvm_path in FrozenOrderedSet(itertools.chain.from_iterable(nvm_path_results)):
-        expanded.append(nvm_path)
+    path_variable = path_variables[0] if path_variables else ()
+    # De-duplicate the NVM installations while preserving their order.
+    expanded: list[str] = list(dict.fromkeys(itertools.chain.from_iterable(nvm_path_results)))
     for s in paths:
         if s == "<PATH>":
-            expanded.extend(await environment_path_variable(**implicitly()))  # noqa: PNT30: Linear search
+            expanded.extend(path_variable)
         elif s in special_strings:
             expanded.extend(special_strings[s])
         elif s == "<NVM>" or s == "<NVM_LOCAL>":
@@ -585,29 +615,48 @@ async def get_valid_nodejs_paths_by_version(bootstrap: NodeJSBootstrap) -> _Bina
         **implicitly(),
     )
 
-    group_by_version = groupby((path for path in paths.paths), key=lambda path: path.fingerprint)
-    return _BinaryPathsPerVersion({version: tuple(paths) for version, paths in group_by_version})
+    paths_per_version: dict[str, list[BinaryPath]] = defaultdict(list)
+    for path in paths.paths:
+        paths_per_version[path.fingerprint].append(path)
+    return _BinaryPathsPerVersion(
+        {version: tuple(version_paths) for version, version_paths in paths_per_version.items()}
+    )
+
+
+@lru_cache(maxsize=32)
+def _decode_known_versions(
+    known_versions: tuple[str, ...],
+) -> FrozenDict[str, tuple[ExternalToolVersion, ...]]:
+    """Decode `[nodejs].known_versions` and group the entries by version.
+
+    The entries for a version need not be adjacent, so this groups by key rather than by run.
+    """
+    decoded_per_version: dict[str, list[ExternalToolVersion]] = defaultdict(list)
+    for unparsed in known_versions:
+        known_version = ExternalToolVersion.decode(unparsed)
+        decoded_per_version[known_version.version].append(known_version)
+    return FrozenDict((version, tuple(decoded)) for version, decoded in decoded_per_version.items())
+
+
+@lru_cache(maxsize=256)
+def _min_satisfying(versions: tuple[str, ...], semver_range: str) -> str | None:
+    return min_satisfying(versions, semver_range)
 
 
 @rule(level=LogLevel.DEBUG, desc="Finding Node.js distribution binaries.")
 async def determine_nodejs_binaries(
     nodejs: NodeJS, platform: Platform, paths_per_version: _BinaryPathsPerVersion
 ) -> NodeJSBinaries:
-    decoded_versions = groupby(
-        (ExternalToolVersion.decode(unparsed) for unparsed in nodejs.known_versions),
-        lambda v: v.version,
-    )
-
     decoded_per_version = {
         version: tuple(
             known_version
             for known_version in known_versions
             if known_version.platform == platform.value
         )
-        for version, known_versions in decoded_versions
+        for version, known_versions in _decode_known_versions(tuple(nodejs.known_versions)).items()
     }
 
-    satisfying_version = min_satisfying(decoded_per_version.keys(), nodejs.version)
+    satisfying_version = _min_satisfying(tuple(decoded_per_version), nodejs.version)
     if satisfying_version:
         known_version = decoded_per_version[satisfying_version][0]
         downloaded = await nodejs.download_known_version(known_version, platform)
@@ -619,7 +668,7 @@ async def determine_nodejs_binaries(
 
         return NodeJSBinaries(nodejs_bin_dir, downloaded.digest)
 
-    satisfying_version = min_satisfying(paths_per_version.keys(), nodejs.version)
+    satisfying_version = _min_satisfying(tuple(paths_per_version), nodejs.version)
     if not satisfying_version:
         raise BinaryNotFoundError(
             softwrap(
@@ -647,22 +696,20 @@ class CorepackToolDigest:
 
 @rule(desc="Preparing Corepack managed tool.")
 async def prepare_corepack_tool(
-    request: CorepackToolRequest, environment: NodeJSProcessEnvironment, nodejs: NodeJS
+    request: CorepackToolRequest, environment: NodeJSProcessEnvironment
 ) -> CorepackToolDigest:
-    version = request.version or nodejs.package_managers.get(request.tool)
+    version = request.version
     tool_spec = f"{request.tool}@{version}" if version else request.tool
     tool_description = tool_spec if version else f"default {tool_spec} version"
     result = await fallible_to_exec_result_or_raise(
         **implicitly(
             Process(
-                argv=filter(
-                    None, ("corepack", "prepare", tool_spec if version else "--all", "--activate")
-                ),
+                argv=("corepack", "prepare", tool_spec if version else "--all", "--activate"),
                 description=f"Preparing configured {tool_description}.",
-                immutable_input_digests=environment.immutable_digest(),
+                immutable_input_digests=environment.immutable_digest,
                 level=LogLevel.DEBUG,
                 env=environment.to_env_dict(),
-                append_only_caches={**environment.append_only_caches},
+                append_only_caches=environment.append_only_caches,
                 output_directories=[environment.corepack_home],
             )
         )
@@ -672,12 +719,15 @@ async def prepare_corepack_tool(
 
 @rule(level=LogLevel.DEBUG)
 async def setup_node_tool_process(
-    request: NodeJSToolProcess, environment: NodeJSProcessEnvironment
+    request: NodeJSToolProcess, environment: NodeJSProcessEnvironment, nodejs: NodeJS
 ) -> Process:
     if request.tool in ("npm", "npx", "pnpm", "yarn"):
         tool_name = request.tool.replace("npx", "npm")
+        # Resolve the default version up front, so that requests for the same effective tool
+        # version share a single `corepack prepare` regardless of how they were spelled.
+        version = request.tool_version or nodejs.package_managers.get(tool_name)
         corepack_tool = await prepare_corepack_tool(
-            CorepackToolRequest(tool_name, request.tool_version), **implicitly()
+            CorepackToolRequest(tool_name, version), **implicitly()
         )
         input_digest = await merge_digests(
             MergeDigests([request.input_digest, corepack_tool.digest])
@@ -685,16 +735,20 @@ async def setup_node_tool_process(
     else:
         input_digest = request.input_digest
     return Process(
-        argv=list(filter(None, (request.tool, *request.args))),
+        argv=[arg for arg in (request.tool, *request.args) if arg],
         input_digest=input_digest,
         output_files=request.output_files,
-        immutable_input_digests=environment.immutable_digest(),
+        immutable_input_digests=environment.immutable_digest,
         output_directories=request.output_directories,
         description=request.description,
         level=request.level,
         env=environment.to_env_dict(request.extra_env),
         working_directory=request.working_directory,
-        append_only_caches={**request.append_only_caches, **environment.append_only_caches},
+        append_only_caches=(
+            request.append_only_caches | environment.append_only_caches
+            if request.append_only_caches
+            else environment.append_only_caches
+        ),
         timeout_seconds=request.timeout_seconds,
     )
 
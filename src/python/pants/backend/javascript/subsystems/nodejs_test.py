@@ -213,6 +213,24 @@ def test_node_version_from_semver_download(
     )
 
 
+def test_node_version_from_non_adjacent_known_versions(mock_nodejs_subsystem: Mock) -> None:
+    nodejs_subsystem = mock_nodejs_subsystem
+    nodejs_subsystem.version = "2.x"
+    nodejs_subsystem.known_versions = [
+        _SEMVER_2_1_0,
+        _SEMVER_1_1_0,
+        _SEMVER_2_1_0.replace("linux_x86_64", "macos_arm64"),
+    ]
+    run_rule_with_mocks(
+        determine_nodejs_binaries,
+        rule_args=(nodejs_subsystem, Platform.linux_x86_64, _BinaryPathsPerVersion()),
+    )
+
+    nodejs_subsystem.download_known_version.assert_called_once_with(
+        ExternalToolVersion.decode(_SEMVER_2_1_0), Platform.linux_x86_64
+    )
+
+
 @pytest.mark.parametrize(
     ("semver_range", "expected_path"),
     [
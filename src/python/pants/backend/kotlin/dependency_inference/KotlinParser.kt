@@ -39,13 +39,15 @@ data class KotlinAnalysis(
     val consumedSymbolsByScope: Map<String, List<String>>
 )
 
-fun parse(code: String): KtFile {
+fun parseAndAnalyze(code: String): KotlinAnalysis {
+    // NB: The parser runs under nailgun, so the compiler environment is disposed after every
+    // analysis to keep its PSI caches from growing across the sources that the JVM serves.
     val disposable = Disposer.newDisposable()
     try {
         val env = KotlinCoreEnvironment.createForProduction(
             disposable, CompilerConfiguration(), EnvironmentConfigFiles.JVM_CONFIG_FILES)
         val file = LightVirtualFile("temp.kt", KotlinFileType.INSTANCE, code)
-        return PsiManager.getInstance(env.project).findFile(file) as KtFile
+        return analyze(PsiManager.getInstance(env.project).findFile(file) as KtFile)
     } finally {
         disposable.dispose()
     }
@@ -165,8 +167,7 @@ fun main(args: Array<String>) {
 
     val sourceContentBytes = Files.readAllBytes(Paths.get(sourcePath))
     val sourceContent = String(sourceContentBytes, StandardCharsets.UTF_8)
-    val parsed = parse(sourceContent)
-    val analysis = analyze(parsed)
+    val analysis = parseAndAnalyze(sourceContent)
 
     val gson = Gson()
     val analysisOutput = gson.toJson(analysis)
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import json
 import os
+import sys
+from collections import defaultdict
 from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 from pants.core.goals.resolves import ExportableTool
@@ -32,7 +35,11 @@ from pants.jvm.compile import ClasspathEntry
 from pants.jvm.jdk_rules import InternalJdk, JdkRequest, JvmProcess, prepare_jdk_environment
 from pants.jvm.resolve.common import ArtifactRequirements
 from pants.jvm.resolve.coordinate import Coordinate
-from pants.jvm.resolve.coursier_fetch import ToolClasspathRequest, materialize_classpath_for_tool
+from pants.jvm.resolve.coursier_fetch import (
+    ToolClasspath,
+    ToolClasspathRequest,
+    materialize_classpath_for_tool,
+)
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, JvmToolBase
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
@@ -57,7 +64,7 @@ class KotlinParser(JvmToolBase):
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class KotlinImport:
     name: str
     alias: str | None
@@ -65,9 +72,10 @@ class KotlinImport:
 
     @classmethod
     def from_json_dict(cls, d: dict) -> KotlinImport:
+        alias = d.get("alias")
         return cls(
-            name=d["name"],
-            alias=d.get("alias"),
+            name=sys.intern(d["name"]),
+            alias=sys.intern(alias) if alias is not None else None,
             is_wildcard=d["isWildcard"],
         )
 
@@ -95,50 +103,83 @@ class KotlinSourceDependencyAnalysis:
         package.
         """
 
-        def scope_and_parents(scope: str) -> Iterator[str]:
-            while True:
-                yield scope
-                if scope == "":
-                    break
-                scope, _, _ = scope.rpartition(".")
+        def scope_and_parents(scope: str) -> tuple[str, ...]:
+            # Slice the scope at each dot from the right, rather than repeatedly partitioning it.
+            parents = [scope]
+            end = len(scope)
+            while end:
+                end = max(scope.rfind(".", 0, end), 0)
+                parents.append(scope[:end])
+            return tuple(parents)
+
+        no_scopes = not self.scopes
+        wildcard_import_names = self._wildcard_import_names
+        import_names_by_first_token = self._import_names_by_first_token
 
         for consumption_scope, consumed_symbols in self.consumed_symbols_by_scope.items():
-            parent_scopes = tuple(scope_and_parents(consumption_scope))
+            parent_scopes = scope_and_parents(consumption_scope)
+            # A package declaration which is a parent of this scope could provide any symbol.
+            declaring_parent_scopes = tuple(
+                scope for scope in parent_scopes if scope in self.scopes
+            )
+            # Imports are only in scope if the package is a parent of this scope.
+            imports_in_scope = self.package in parent_scopes
             for symbol in consumed_symbols:
                 symbol_rel_prefix, dot_in_symbol, symbol_rel_suffix = symbol.partition(".")
-                if not self.scopes or dot_in_symbol:
+                if no_scopes or dot_in_symbol:
                     # TODO: Similar to #13545: we assume that a symbol containing a dot might already
                     # be fully qualified.
                     yield symbol
-                for parent_scope in parent_scopes:
-                    if parent_scope in self.scopes:
-                        # A package declaration is a parent of this scope, and any of its symbols
-                        # could be in scope.
-                        yield f"{parent_scope}.{symbol}"
-
-                    for imp in self.imports if parent_scope == self.package else ():
-                        if imp.is_wildcard:
-                            # There is a wildcard import in a parent scope.
-                            yield f"{imp.name}.{symbol}"
-                        if dot_in_symbol:
-                            # If the parent scope has an import which defines the first token of the
-                            # symbol, then it might be a relative usage of an import.
-                            if imp.alias:
-                                if imp.alias == symbol_rel_prefix:
-                                    yield f"{imp.name}.{symbol_rel_suffix}"
-                            elif imp.name.endswith(f".{symbol_rel_prefix}"):
-                                yield f"{imp.name}.{symbol_rel_suffix}"
+                for parent_scope in declaring_parent_scopes:
+                    yield f"{parent_scope}.{symbol}"
+
+                if not imports_in_scope:
+                    continue
+                for name in wildcard_import_names:
+                    # There is a wildcard import in a parent scope.
+                    yield f"{name}.{symbol}"
+                if dot_in_symbol:
+                    # If the parent scope has an import which defines the first token of the
+                    # symbol, then it might be a relative usage of an import.
+                    for name in import_names_by_first_token.get(symbol_rel_prefix, ()):
+                        yield f"{name}.{symbol_rel_suffix}"
+
+    @cached_property
+    def _wildcard_import_names(self) -> tuple[str, ...]:
+        return tuple(imp.name for imp in self.imports if imp.is_wildcard)
+
+    @cached_property
+    def _import_names_by_first_token(self) -> FrozenDict[str, tuple[str, ...]]:
+        """Import names keyed by the token which a relative usage of the import would start with.
+
+        That is the alias of an aliased import, or else the last component of the imported name.
+        """
+        names_by_token: defaultdict[str, list[str]] = defaultdict(list)
+        for imp in self.imports:
+            if imp.alias:
+                names_by_token[imp.alias].append(imp.name)
+            else:
+                _, dot, last_component = imp.name.rpartition(".")
+                if dot:
+                    names_by_token[last_component].append(imp.name)
+        return FrozenDict((token, tuple(names)) for token, names in names_by_token.items())
 
     @classmethod
     def from_json_dict(cls, d: dict) -> KotlinSourceDependencyAnalysis:
+        # NB: Package, scope and symbol names recur across the files of a repo, and analyses are
+        # held in the engine's memo for the life of the daemon, so we intern them to share one
+        # copy of each.
         return cls(
-            package=d["package"],
-            imports=frozenset(KotlinImport.from_json_dict(i) for i in d["imports"]),
-            named_declarations=frozenset(d["namedDeclarations"]),
+            package=sys.intern(d["package"]),
+            imports=frozenset([KotlinImport.from_json_dict(i) for i in d["imports"]]),
+            named_declarations=frozenset(map(sys.intern, d["namedDeclarations"])),
             consumed_symbols_by_scope=FrozenDict(
-                {k: frozenset(v) for k, v in d["consumedSymbolsByScope"].items()}
+                {
+                    sys.intern(k): frozenset(map(sys.intern, v))
+                    for k, v in d["consumedSymbolsByScope"].items()
+                }
             ),
-            scopes=frozenset(d["scopes"]),
+            scopes=frozenset(map(sys.intern, d["scopes"])),
         )
 
     def to_debug_json_dict(self) -> dict[str, Any]:
@@ -162,17 +203,40 @@ class KotlinParserCompiledClassfiles(ClasspathEntry):
     pass
 
 
-@rule(level=LogLevel.DEBUG)
-async def analyze_kotlin_source_dependencies(
+@dataclass(frozen=True)
+class KotlinParserRuntime:
+    """The JDK and classpaths used to run the Kotlin parser, shared by every source analysis."""
+
+    jdk: InternalJdk
+    tool_classpath: ToolClasspath
+    processor_classfiles: KotlinParserCompiledClassfiles
+
+
+@rule
+async def setup_kotlin_parser_runtime(
     processor_classfiles: KotlinParserCompiledClassfiles,
-    source_files: SourceFiles,
     tool: KotlinParser,
-) -> FallibleKotlinSourceDependencyAnalysisResult:
+) -> KotlinParserRuntime:
     # Use JDK 8 due to https://youtrack.jetbrains.com/issue/KTIJ-17192 and https://youtrack.jetbrains.com/issue/KT-37446.
     request = JdkRequest("zulu:8.0.392")
-    env = await prepare_jdk_environment(**implicitly({request: JdkRequest}))
-    jdk = InternalJdk.from_jdk_environment(env)
+    env, tool_classpath = await concurrently(
+        prepare_jdk_environment(**implicitly({request: JdkRequest})),
+        materialize_classpath_for_tool(
+            ToolClasspathRequest(lockfile=(GenerateJvmLockfileFromTool.create(tool)))
+        ),
+    )
+    return KotlinParserRuntime(
+        jdk=InternalJdk.from_jdk_environment(env),
+        tool_classpath=tool_classpath,
+        processor_classfiles=processor_classfiles,
+    )
+
 
+@rule(level=LogLevel.DEBUG)
+async def analyze_kotlin_source_dependencies(
+    runtime: KotlinParserRuntime,
+    source_files: SourceFiles,
+) -> FallibleKotlinSourceDependencyAnalysisResult:
     if len(source_files.files) > 1:
         raise ValueError(
             f"analyze_kotlin_source_dependencies expects sources with exactly 1 source file, but found {len(source_files.snapshot.files)}."
@@ -186,19 +250,13 @@ async def analyze_kotlin_source_dependencies(
     processorcp_relpath = "__processorcp"
     toolcp_relpath = "__toolcp"
 
-    (
-        tool_classpath,
-        prefixed_source_files_digest,
-    ) = await concurrently(
-        materialize_classpath_for_tool(
-            ToolClasspathRequest(lockfile=(GenerateJvmLockfileFromTool.create(tool)))
-        ),
-        add_prefix(AddPrefix(source_files.snapshot.digest, source_prefix)),
+    prefixed_source_files_digest = await add_prefix(
+        AddPrefix(source_files.snapshot.digest, source_prefix)
     )
 
     extra_immutable_input_digests = {
-        toolcp_relpath: tool_classpath.digest,
-        processorcp_relpath: processor_classfiles.digest,
+        toolcp_relpath: runtime.tool_classpath.digest,
+        processorcp_relpath: runtime.processor_classfiles.digest,
     }
 
     analysis_output_path = "__source_analysis.json"
@@ -206,9 +264,9 @@ async def analyze_kotlin_source_dependencies(
     process_result = await execute_process(
         **implicitly(
             JvmProcess(
-                jdk=jdk,
+                jdk=runtime.jdk,
                 classpath_entries=[
-                    *tool_classpath.classpath_entries(toolcp_relpath),
+                    *runtime.tool_classpath.classpath_entries(toolcp_relpath),
                     processorcp_relpath,
                 ],
                 argv=[
@@ -121,3 +121,37 @@ def test_parser_simple(rule_runner: RuleRunner) -> None:
         "org.pantsbuild.backend.kotlin.Foo",
         "org.pantsbuild.backend.kotlin.Bar",
     }
+
+
+def test_fully_qualified_consumed_symbols() -> None:
+    analysis = KotlinSourceDependencyAnalysis(
+        package="org.example",
+        imports=frozenset(
+            {
+                KotlinImport(name="java.io.File", alias=None, is_wildcard=False),
+                KotlinImport(name="java.nio.file.Paths", alias="P", is_wildcard=False),
+                KotlinImport(name="kotlin.collections", alias=None, is_wildcard=True),
+            }
+        ),
+        named_declarations=frozenset({"org.example.Foo"}),
+        consumed_symbols_by_scope=FrozenDict(
+            {"org.example.Foo": frozenset({"Bar", "File.separator", "P.get"})}
+        ),
+        scopes=frozenset({"org.example", "org.example.Foo"}),
+    )
+
+    assert sorted(set(analysis.fully_qualified_consumed_symbols())) == [
+        "File.separator",
+        "P.get",
+        "java.io.File.separator",
+        "java.nio.file.Paths.get",
+        "kotlin.collections.Bar",
+        "kotlin.collections.File.separator",
+        "kotlin.collections.P.get",
+        "org.example.Bar",
+        "org.example.File.separator",
+        "org.example.Foo.Bar",
+        "org.example.Foo.File.separator",
+        "org.example.Foo.P.get",
+        "org.example.P.get",
+    ]
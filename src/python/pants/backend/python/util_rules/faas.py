@@ -76,7 +76,8 @@ from pants.engine.target import (
 from pants.engine.unions import UnionRule
 from pants.source.source_root import SourceRootRequest, get_source_root
 from pants.util.docutil import doc_url
-from pants.util.ordered_set import FrozenOrderedSet
+from pants.util.frozendict import FrozenDict
+from pants.util.memo import memoized, memoized_classmethod
 from pants.util.strutil import help_text, softwrap
 
 logger = logging.getLogger(__name__)
@@ -197,8 +198,10 @@ async def resolve_python_faas_handler(
         )
     handler_path = handler_paths.files[0]
     source_root = await get_source_root(SourceRootRequest.for_file(handler_path))
-    stripped_source_path = os.path.relpath(handler_path, source_root.path)
-    module_base, _ = os.path.splitext(stripped_source_path)
+    # The handler path is a file under its source root that ends in `.py`, so slice both off
+    # rather than normalizing the path with `os.path.relpath` and `os.path.splitext`.
+    source_root_prefix_len = 0 if source_root.path == "." else len(source_root.path) + 1
+    module_base = handler_path[source_root_prefix_len : -len(".py")]
     normalized_path = module_base.replace(os.path.sep, ".")
     return ResolvedPythonFaaSHandler(module=normalized_path, func=func, file_name_used=True)
 
@@ -317,6 +320,16 @@ class PythonFaaSRuntimeField(StringField, ABC):
 
     known_runtimes: ClassVar[tuple[PythonFaaSKnownRuntime, ...]] = ()
 
+    @memoized_classmethod
+    def known_runtimes_by_version_and_architecture(  # type: ignore[misc]
+        cls: type[PythonFaaSRuntimeField],
+    ) -> FrozenDict[tuple[tuple[int, int], FaaSArchitecture], PythonFaaSKnownRuntime]:
+        runtimes: dict[tuple[tuple[int, int], FaaSArchitecture], PythonFaaSKnownRuntime] = {}
+        for rt in cls.known_runtimes:
+            # The first runtime declared for a given version and architecture wins.
+            runtimes.setdefault(((rt.major, rt.minor), FaaSArchitecture(rt.architecture)), rt)
+        return FrozenDict(runtimes)
+
     @classmethod
     def known_runtimes_complete_platforms_module(cls) -> str:
         # the runtime field subclasses are conventionally in a `target_types.py` file, and we want
@@ -417,6 +430,13 @@ async def _infer_from_ics(request: RuntimePlatformsRequest) -> tuple[int, int]:
     )
 
 
+@memoized
+def _read_known_runtime_complete_platform(module: str, file_name: str) -> bytes:
+    # The bundled complete platforms are shared by every target using the same runtime, and cannot
+    # change while this process runs.
+    return (importlib.resources.files(module) / file_name).read_bytes()
+
+
 @rule
 async def infer_runtime_platforms(request: RuntimePlatformsRequest) -> RuntimePlatforms:
     if request.complete_platforms.value is not None:
@@ -434,18 +454,15 @@ async def infer_runtime_platforms(request: RuntimePlatformsRequest) -> RuntimePl
         version = await _infer_from_ics(request)
         inferred_from_ics = True
 
-    try:
-        file_name = next(
-            rt.file_name()
-            for rt in request.runtime.known_runtimes
-            if version == (rt.major, rt.minor) and request.architecture.value == rt.architecture
-        )
-    except StopIteration:
+    known_runtime = request.runtime.known_runtimes_by_version_and_architecture().get(
+        (version, request.architecture)
+    )
+    if known_runtime is None:
         # No known runtime, so prompt the user to specify
         version_modifier = "[inferred from interpreter constraints]" if inferred_from_ics else ""
         version_adjective = "inferred" if inferred_from_ics else "specified"
         known_runtimes_str = ", ".join(
-            FrozenOrderedSet(r.name for r in request.runtime.known_runtimes)
+            dict.fromkeys(r.name for r in request.runtime.known_runtimes)
         )
         raise InvalidTargetException(
             softwrap(
@@ -465,11 +482,12 @@ async def infer_runtime_platforms(request: RuntimePlatformsRequest) -> RuntimePl
                 """
             ),
             description_of_origin=f"In the {request.target_name!r} target",
-        ) from None
+        )
 
+    file_name = known_runtime.file_name()
     module = request.runtime.known_runtimes_complete_platforms_module()
 
-    content = (importlib.resources.files(module) / file_name).read_bytes()
+    content = _read_known_runtime_complete_platform(module, file_name)
     snapshot = await digest_to_snapshot(
         **implicitly(CreateDigest([FileContent(file_name, content)]))
     )
@@ -619,10 +637,9 @@ async def build_python_faas(
     )
     digest = await merge_digests(MergeDigests([result.digest, metadata_digest]))
 
-    extra_log_lines = [f"    {key.capitalize()}: {val}" for key, val in metadata.items()]
     artifact = BuiltPackageArtifact(
         output_filename,
-        extra_log_lines=tuple(extra_log_lines),
+        extra_log_lines=tuple(f"    {key.capitalize()}: {val}" for key, val in metadata.items()),
     )
     metadata_artifact = BuiltPackageArtifact(metadata_filename)
 
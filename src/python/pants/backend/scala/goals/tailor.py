@@ -35,22 +35,17 @@ class PutativeScalaTargetsRequest(PutativeTargetsRequest):
     pass
 
 
+_SCALATEST_FILESPEC_MATCHER = FilespecMatcher(ScalatestTestsGeneratorSourcesField.default, ())
+_JUNIT_FILESPEC_MATCHER = FilespecMatcher(ScalaJunitTestsGeneratorSourcesField.default, ())
+
+
 def classify_source_files(paths: Iterable[str]) -> dict[type[Target], set[str]]:
     """Returns a dict of target type -> files that belong to targets of that type."""
-    scalatest_filespec_matcher = FilespecMatcher(ScalatestTestsGeneratorSourcesField.default, ())
-    junit_filespec_matcher = FilespecMatcher(ScalaJunitTestsGeneratorSourcesField.default, ())
-    scalatest_files = {
-        path
-        for path in paths
-        if os.path.basename(path)
-        in set(scalatest_filespec_matcher.matches([os.path.basename(path) for path in paths]))
-    }
-    junit_files = {
-        path
-        for path in paths
-        if os.path.basename(path)
-        in set(junit_filespec_matcher.matches([os.path.basename(path) for path in paths]))
-    }
+    basenames = [os.path.basename(path) for path in paths]
+    scalatest_filenames = set(_SCALATEST_FILESPEC_MATCHER.matches(basenames))
+    junit_filenames = set(_JUNIT_FILESPEC_MATCHER.matches(basenames))
+    scalatest_files = {path for path in paths if os.path.basename(path) in scalatest_filenames}
+    junit_files = {path for path in paths if os.path.basename(path) in junit_filenames}
     sources_files = set(paths) - scalatest_files - junit_files
     return {
         ScalaJunitTestsGeneratorTarget: junit_files,
@@ -70,7 +65,9 @@ async def find_putative_targets(
     if scala_subsystem.tailor_source_targets:
         all_scala_files_globs = req.path_globs("*.scala")
         all_scala_files = await path_globs_to_paths(all_scala_files_globs)
-        unowned_scala_files = set(all_scala_files.files) - set(all_owned_sources)
+        unowned_scala_files = set(all_scala_files.files).difference(all_owned_sources)
+        if not unowned_scala_files:
+            return PutativeTargets()
         classified_unowned_scala_files = classify_source_files(unowned_scala_files)
         for tgt_type, paths in classified_unowned_scala_files.items():
             for dirname, filenames in group_by_dir(paths).items():
@@ -1,8 +1,7 @@
 # Copyright 2015 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
-import os
-import re
+import itertools
 from pathlib import Path
 from textwrap import dedent
 
@@ -109,17 +108,24 @@ def test_pants_symlink_workdirs(tmp_path: Path) -> None:
     )
     pants_run.assert_success()
     # Make sure symlink workdir is pointing to physical workdir
-    assert Path(os.readlink(symlink_workdir.as_posix())) == physical_workdir
+    assert symlink_workdir.readlink() == physical_workdir
 
 
 def test_fromfile_invalidation(tmp_path: Path) -> None:
     workdir = (tmp_path / "workdir").as_posix()
     pid = None
+    pid_prefix = "running with PID: "
 
     def assert_same_daemon():
         nonlocal pid
-        logs = "\n".join(read_pants_log(workdir))
-        pids = [m.group("pid") for m in re.finditer(r"running with PID: (?P<pid>\d+)", logs)]
+        pids = []
+        for line in read_pants_log(workdir):
+            idx = line.find(pid_prefix)
+            if idx == -1:
+                continue
+            pid_digits = "".join(itertools.takewhile(str.isdigit, line[idx + len(pid_prefix) :]))
+            if pid_digits:
+                pids.append(pid_digits)
         assert len(pids) == 1
         if pid is None:
             pid = pids[0]
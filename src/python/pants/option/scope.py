@@ -1,7 +1,8 @@
 # Copyright 2015 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any, cast
 
 from pants.option.option_value_container import OptionValueContainer
@@ -10,18 +11,21 @@ GLOBAL_SCOPE = ""
 GLOBAL_SCOPE_CONFIG_SECTION = "GLOBAL"
 
 
-def normalize_scope(scope: str):
+def normalize_scope(scope: str) -> str:
     return scope.lower().replace("-", "_")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Scope:
     """An options scope."""
 
     scope: str
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "scope", sys.intern(self.scope))
+
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class ScopeInfo:
     """Information about a scope."""
 
@@ -42,25 +46,30 @@ class ScopeInfo:
     # Auxiliary goals, such as the `experimental-bsp` goal.
     is_auxiliary: bool = False
 
-    @property
-    def description(self) -> str:
-        return cast(str, self._subsystem_cls_attr("help"))
-
-    @property
-    def deprecated_scope(self) -> str | None:
-        return cast(str | None, self._subsystem_cls_attr("deprecated_options_scope"))
-
-    @property
-    def deprecated_scope_removal_version(self) -> str | None:
-        return cast(
-            str | None,
+    # NB: These are read from the subsystem_cls once, since options registration looks up the
+    # deprecated_scope for every registered option.
+    deprecated_scope: str | None = field(init=False, repr=False, compare=False)
+    deprecated_scope_removal_version: str | None = field(init=False, repr=False, compare=False)
+    # BuiltinGoal subsystems may define aliases.
+    scope_aliases: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Scope names are compared throughout options parsing: interning lets equal names share one
+        # object, so that comparisons short-circuit on identity.
+        object.__setattr__(self, "scope", sys.intern(self.scope))
+        object.__setattr__(
+            self, "deprecated_scope", self._subsystem_cls_attr("deprecated_options_scope")
+        )
+        object.__setattr__(
+            self,
+            "deprecated_scope_removal_version",
             self._subsystem_cls_attr("deprecated_options_scope_removal_version"),
         )
+        object.__setattr__(self, "scope_aliases", self._subsystem_cls_attr("aliases", ()))
 
     @property
-    def scope_aliases(self) -> tuple[str, ...]:
-        """BuiltinGoal subsystems may define aliases."""
-        return cast(tuple[str, ...], self._subsystem_cls_attr("aliases", ()))
+    def description(self) -> str:
+        return cast(str, self._subsystem_cls_attr("help"))
 
     def _subsystem_cls_attr(self, name: str, default=None):
         return getattr(self.subsystem_cls, name, default) if self.subsystem_cls else default
@@ -74,7 +83,7 @@ class OptionsParsingSettings:
     allow_unknown_options: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScopedOptions:
     """A wrapper around options selected for a particular Scope."""
 